@@ -1,3 +1,5 @@
+import asyncio
+
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 import settings
 import logging
@@ -11,10 +13,33 @@ class DataBase:
 db = DataBase()
 
 
+async def ensure_indexes():
+    """Create the indexes backing the patient/case lookups. Idempotent."""
+    await asyncio.gather(
+        db.cdss.medications.create_index([("patient_id", 1), ("end_date", 1)]),
+        db.cdss.diagnoses.create_index("patient_id"),
+        db.cdss.tests.create_index("patient_id"),
+        db.cdss.treatments.create_index("patient_id"),
+        db.cdss.demographics.create_index("patient_id"),
+        db.cdss.transcriptions.create_index("case_id"),
+    )
+
+
 async def connect_to_mongo():
     logging.info("Connecting to mongo...")
-    db.client = AsyncIOMotorClient(settings.MONGODB_URI, maxPoolSize=10, minPoolSize=10)
+    db.client = AsyncIOMotorClient(
+        settings.MONGODB_URI,
+        maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
+        minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
+        serverSelectionTimeoutMS=3000,
+        connectTimeoutMS=5000,
+        socketTimeoutMS=10000,
+        retryWrites=True,
+    )
     db.cdss = db.client.get_database("cdss")
+    # Force server selection and the handshake now rather than on the first request
+    await db.client.admin.command("ping")
+    await ensure_indexes()
     logging.info("connected to zvms...")
 
 
@@ -1,8 +1,16 @@
+import asyncio
+import logging
 from datetime import datetime, timezone
+from typing import Dict
 
 from bson import ObjectId
 
 from database import db
+from services.summary_cache import (
+    cache_summary,
+    get_cached_summary,
+    summary_generation,
+)
 from kernel.chat_output import (
     PatientSummary,
     Medicine as MedicineOutput,
@@ -10,24 +18,126 @@ from kernel.chat_output import (
     TestResult as TestResultOutput,
 )
 
+logger = logging.getLogger(__name__)
+
+
+class CaseDataNotFound(ValueError):
+    """Raised when the records needed to summarize a case are missing."""
+
+
+# Only the fields read below are pulled from Mongo, so notes-heavy documents
+# and attachments are neither sent over the wire nor decoded.
+# _id is kept on demographics so an existing record never projects to an empty,
+# falsy document.
+CASE_PROJECTION = {"patient_id": 1}
+DEMOGRAPHICS_PROJECTION = {"name": 1, "age": 1, "gender": 1}
+TRANSCRIPTION_PROJECTION = {
+    "_id": 0,
+    "chief_complaint": 1,
+    "history_of_present_illness": 1,
+}
+MEDICATION_PROJECTION = {
+    "_id": 0,
+    "medicine_name": 1,
+    "dosage": 1,
+    "route": 1,
+    "frequency": 1,
+    "notes": 1,
+}
+DIAGNOSIS_PROJECTION = {
+    "_id": 0,
+    "diagnosis_name": 1,
+    "status": 1,
+    "notes": 1,
+    "follow_up": 1,
+}
+TEST_PROJECTION = {"_id": 0, "test_name": 1, "notes": 1}
+TREATMENT_PROJECTION = {
+    "_id": 0,
+    "treatment_name": 1,
+    "treatment_type": 1,
+    "treatment_date": 1,
+}
+
+
+def _lookup(collection: str, match: dict, projection: dict, as_field: str) -> dict:
+    return {
+        "$lookup": {
+            "from": collection,
+            "let": {"patient_id": "$patient_id", "case_id": {"$toString": "$_id"}},
+            "pipeline": [{"$match": {"$expr": match}}, {"$project": projection}],
+            "as": as_field,
+        }
+    }
+
+
+def _summary_pipeline(case_oid: ObjectId, now: datetime) -> list:
+    """
+    Joins everything the summary needs onto the case document, so the whole
+    summary is fetched in one aggregate round trip.
+    """
+    same_patient = {"$eq": ["$patient_id", "$$patient_id"]}
+    return [
+        {"$match": {"_id": case_oid}},
+        {"$project": CASE_PROJECTION},
+        _lookup(
+            "demographics",
+            same_patient,
+            DEMOGRAPHICS_PROJECTION,
+            "demographics",
+        ),
+        _lookup(
+            "transcriptions",
+            {"$eq": ["$case_id", "$$case_id"]},
+            TRANSCRIPTION_PROJECTION,
+            "transcriptions",
+        ),
+        _lookup(
+            "medications",
+            {
+                "$and": [
+                    same_patient,
+                    {
+                        "$or": [
+                            {"$eq": [{"$type": "$end_date"}, "missing"]},
+                            {"$gt": ["$end_date", now]},
+                        ]
+                    },
+                ]
+            },
+            MEDICATION_PROJECTION,
+            "medications",
+        ),
+        _lookup("diagnoses", same_patient, DIAGNOSIS_PROJECTION, "diagnoses"),
+        _lookup("tests", same_patient, TEST_PROJECTION, "tests"),
+        _lookup("treatments", same_patient, TREATMENT_PROJECTION, "treatments"),
+    ]
+
 
 async def summarize_user_data(case_id: str) -> PatientSummary:
-    patient_case = await db.cdss.get_collection("cases").find_one({"_id": ObjectId(case_id)})
+    case_oid = ObjectId(case_id)
+    now_utc = datetime.now(timezone.utc)
+    now_iso = now_utc.isoformat()
+    results = (
+        await db.cdss.get_collection("cases")
+        .aggregate(_summary_pipeline(case_oid, now_utc))
+        .to_list(length=1)
+    )
+    patient_case = results[0] if results else None
     patient_id = patient_case.get("patient_id") if patient_case else None
     if not patient_id:
-        raise "Patient ID not found for the given case."
-    patient_demographics = await db.cdss.get_collection("demographics").find_one(
-        {"patient_id": patient_id}
-    )
-    if not patient_demographics:
-        raise "Patient demographics not found for the given patient ID."
-    transcription_results = await db.cdss.get_collection("transcriptions").find_one(
-        {"case_id": case_id}
-    )
-    demographics = await db.cdss.get_collection("demographics").find_one(
-        {"patient_id": patient_id}
-    )
-    print("Demographics:", demographics)
+        raise CaseDataNotFound(f"Patient ID not found for case {case_id}.")
+    demographics = next(iter(patient_case["demographics"]), None)
+    transcription_results = next(iter(patient_case["transcriptions"]), None)
+    meditation_info = patient_case["medications"]
+    diagnoses_history = patient_case["diagnoses"]
+    test_results_history = patient_case["tests"]
+    treatments_history = patient_case["treatments"]
+    if not demographics:
+        raise CaseDataNotFound(
+            f"Patient demographics not found for patient {patient_id}."
+        )
+    logger.debug("Demographics: %s", demographics)
     patient_info = {
         "id": patient_id,
         "name": demographics.get("name", "Unknown"),
@@ -38,25 +148,14 @@ async def summarize_user_data(case_id: str) -> PatientSummary:
             "history_of_present_illness", "Unknown"
         ),
     }
-    print("Patient Info:", patient_info)
-    meditation_info = (
-        await db.cdss.get_collection("medications")
-        .find(
-            {
-                "patient_id": patient_id,
-                "$or": [
-                    { "end_date": { "$exists": False } },
-                    { "end_date": { "$gt": datetime.now() } }
-                ]
-            }
-        )
-        .to_list(length=None)
-    )
-    print("Current Medications:", meditation_info)
+    logger.debug("Patient Info: %s", patient_info)
+    logger.debug("Current Medications: %s", meditation_info)
+    # Records below come from our own collections, so the output models are
+    # built with model_construct and skip per-field validation.
     current_medications = []
     for med in meditation_info:
         current_medications.append(
-            MedicineOutput(
+            MedicineOutput.model_construct(
                 medicine_name=med.get("medicine_name", "Unknown"),
                 dosage=med.get("dosage", "Unknown"),
                 route=med.get("route", "Unknown"),
@@ -64,41 +163,26 @@ async def summarize_user_data(case_id: str) -> PatientSummary:
                 notes=med.get("notes", ""),
             )
         )
-    diagnoses_history = (
-        await db.cdss.get_collection("diagnoses")
-        .find({"patient_id": patient_id})
-        .to_list(length=None)
-    )
     diagnoses = []
     for diagnosis in diagnoses_history:
         diagnoses.append(
-            DiagnosisOutput(
+            DiagnosisOutput.model_construct(
                 diagnosis_name=diagnosis.get("diagnosis_name", "Unknown"),
-                diagnosis_date=datetime.now(timezone.utc).isoformat(),
+                diagnosis_date=now_iso,
                 status=diagnosis.get("status", "Unknown"),
                 notes=diagnosis.get("notes", ""),
                 follow_up=diagnosis.get("follow_up", ""),
             )
         )
-    test_results_history = (
-        await db.cdss.get_collection("tests")
-        .find({"patient_id": patient_id})
-        .to_list(length=None)
-    )
     test_results = []
     for test in test_results_history:
         test_results.append(
-            TestResultOutput(
+            TestResultOutput.model_construct(
                 test_name=test.get("test_name", "Unknown"),
                 results=[],
                 notes=test.get("notes", ""),
             )
         )
-    treatments_history = (
-        await db.cdss.get_collection("treatments")
-        .find({"patient_id": patient_id})
-        .to_list(length=None)
-    )
     treatments = []
     for treatment in treatments_history:
         treatments.append(
@@ -108,7 +192,7 @@ async def summarize_user_data(case_id: str) -> PatientSummary:
                 "treatment_date": treatment.get("treatment_date", "Unknown"),
             }
         )
-    patient_summary = PatientSummary(
+    patient_summary = PatientSummary.model_construct(
         patient_info=patient_info,
         current_medications=current_medications,
         diagnoses_history=diagnoses,
@@ -116,3 +200,38 @@ async def summarize_user_data(case_id: str) -> PatientSummary:
         treatments_history=treatments,
     )
     return patient_summary
+
+
+# In-flight loads, so concurrent misses for a case share one Mongo query. An
+# entry lives only until its load resolves.
+_summary_loads: Dict[str, "asyncio.Future[PatientSummary]"] = {}
+
+
+async def _load_summary(case_id: str) -> PatientSummary:
+    # Taken before reading, so a write that lands mid-load keeps the result
+    # out of the cache
+    generation = summary_generation()
+    summary = await summarize_user_data(case_id)
+    cache_summary(case_id, summary.patient_info.get("id"), summary, generation)
+    return summary
+
+
+async def get_patient_summary(case_id: str) -> PatientSummary:
+    """
+    Cached variant of summarize_user_data.
+
+    Concurrent misses for the same case await a single shared load, so only
+    one of them queries Mongo; its result or error is delivered to all. The
+    cache is per process (see services.summary_cache).
+    """
+    summary = get_cached_summary(case_id)
+    if summary is not None:
+        return summary
+
+    load = _summary_loads.get(case_id)
+    if load is None:
+        load = _summary_loads[case_id] = asyncio.ensure_future(_load_summary(case_id))
+        load.add_done_callback(lambda _: _summary_loads.pop(case_id, None))
+    # A cancelled caller must not cancel the load the others are waiting on
+    return await asyncio.shield(load)
+
@@ -1,12 +1,19 @@
-import os
+import asyncio
 import json
+import logging
 from datetime import date, datetime
 from typing import List, Optional, Literal
-from openai import OpenAI
 from pydantic import BaseModel, Field, ValidationError
-from dotenv import load_dotenv
 
 from kernel.chat_output import PatientSummary
+from kernel.openai_client import (
+    OPENAI_API_KEY,
+    USE_PPIO,
+    get_openai_client,
+    get_ppio_client,
+)
+
+logger = logging.getLogger(__name__)
 
 
 # --- 1. Pydantic Models for Structured Output ---
@@ -62,7 +69,7 @@ class ClinicalPlan(BaseModel):
 
 
 # --- 2. Function to Call OpenAI API ---
-def generate_clinical_plan(patient_data: PatientSummary) -> Optional[ClinicalPlan]:
+async def generate_clinical_plan(patient_data: PatientSummary) -> Optional[ClinicalPlan]:
     """
     Analyzes patient data and generates a structured diagnosis and treatment plan.
 
@@ -73,18 +80,11 @@ def generate_clinical_plan(patient_data: PatientSummary) -> Optional[ClinicalPla
     Returns:
         A Pydantic ClinicalPlan object, or None on error.
     """
-    load_dotenv()
-    api_key = os.getenv("OPENAI_API_KEY")
-    use_ppio = os.getenv("PPIO", 1)
-    if not api_key:
-        print("Error: OPENAI_API_KEY not found in .env file.")
+    if not OPENAI_API_KEY:
+        logger.error("OPENAI_API_KEY not found in .env file.")
         return None
 
-    if use_ppio:
-        client = OpenAI(api_key=os.getenv("PPIO_KEY"), base_url="https://api.ppinfra.com/v3/openai")
-    else:
-        client = OpenAI(api_key=api_key)
-
+    client = get_ppio_client() if USE_PPIO else get_openai_client()
 
     # --- The Core Prompt Engineering ---
     system_prompt = f"""
@@ -115,35 +115,36 @@ def generate_clinical_plan(patient_data: PatientSummary) -> Optional[ClinicalPla
     """
 
     try:
-        print("Requesting clinical plan from OpenAI...")
-        response = client.chat.completions.parse(
-            model="gpt-4o" if not use_ppio else "qwen/qwen3-235b-a22b-thinking-2507",
+        logger.debug("Requesting clinical plan from OpenAI...")
+        response = await client.chat.completions.parse(
+            model="gpt-4o" if not USE_PPIO else "qwen/qwen3-235b-a22b-thinking-2507",
             response_format=ClinicalPlan,
             messages=[
                 {"role": "system", "content": system_prompt},
                 {
                     "role": "user",
-                    "content": f"Patient Data:\n\n{patient_data.model_dump()}",
+                    "content": f"Patient Data:\n\n{patient_data.prompt_json}",
                 },
             ],
         )
 
-        response_content = response.choices[0].message.content
-        print("Received raw response from OpenAI.")
+        message = response.choices[0].message
+        logger.debug("Received raw response from OpenAI.")
 
         # --- 3. Parsing and Validation with Pydantic ---
-        parsed_json = json.loads(response_content)
-        validated_plan = ClinicalPlan.model_validate(parsed_json)
+        # `parse` already validated the content against ClinicalPlan.
+        if message.parsed is None:
+            logger.warning("OpenAI did not return a clinical plan: %s", message.refusal)
+            return None
 
-        print("Successfully parsed and validated the clinical plan.")
-        return validated_plan
+        logger.debug("Successfully parsed and validated the clinical plan.")
+        return message.parsed
 
     except (json.JSONDecodeError, ValidationError) as e:
-        print(f"Error processing OpenAI response: {e}")
-        print("Raw response content:", response_content)
+        logger.error("Error processing OpenAI response: %s", e)
         return None
     except Exception as e:
-        print(f"An unexpected error occurred: {e}")
+        logger.error("An unexpected error occurred: %s", e)
         return None
 
 
@@ -188,7 +189,7 @@ if __name__ == "__main__":
         ],
     }
 
-    clinical_plan = generate_clinical_plan(sample_patient_data)
+    clinical_plan = asyncio.run(generate_clinical_plan(sample_patient_data))
 
     if clinical_plan:
         print("\n--- Generated Clinical Plan ---")
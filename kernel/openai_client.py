@@ -0,0 +1,79 @@
+import gzip
+import os
+from functools import lru_cache
+from typing import Optional
+
+import httpx
+from dotenv import load_dotenv
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+load_dotenv()
+
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+# Opt-in: only an explicit truthy PPIO routes calls to the PPIO endpoint.
+USE_PPIO = os.getenv("PPIO", "").lower() in ("1", "true", "yes")
+PPIO_BASE_URL = "https://api.ppinfra.com/v3/openai"
+
+# Opt-in: gzip request bodies larger than the threshold. Only enable this for
+# endpoints known to accept `Content-Encoding: gzip` on requests.
+GZIP_REQUESTS = os.getenv("OPENAI_GZIP_REQUESTS", "").lower() in ("1", "true")
+GZIP_MIN_BYTES = 1024
+
+
+class _GzipRequestTransport(httpx.AsyncHTTPTransport):
+    """Compresses large request bodies, e.g. prompts embedding patient JSON."""
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if "Content-Encoding" not in request.headers:
+            body = await request.aread()
+            if len(body) >= GZIP_MIN_BYTES:
+                compressed = gzip.compress(body)
+                request.headers["Content-Encoding"] = "gzip"
+                request.headers["Content-Length"] = str(len(compressed))
+                request.stream = httpx.ByteStream(compressed)
+        return await super().handle_async_request(request)
+
+
+def _http_client() -> Optional[httpx.AsyncClient]:
+    # httpx already sends `Accept-Encoding: gzip` and decodes compressed
+    # responses, so a custom client is only needed to compress requests.
+    if not GZIP_REQUESTS:
+        return None
+    return DefaultAsyncHttpxClient(
+        transport=_GzipRequestTransport(
+            retries=2,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        )
+    )
+
+
+@lru_cache(maxsize=None)
+def get_openai_client() -> AsyncOpenAI:
+    """
+    Returns the process-wide OpenAI client.
+
+    The client is async so requests never block the event loop, and it owns
+    an HTTP connection pool, so sharing it keeps connections alive between
+    requests instead of paying a TLS handshake on every call.
+    """
+    return AsyncOpenAI(api_key=OPENAI_API_KEY, http_client=_http_client())
+
+
+@lru_cache(maxsize=None)
+def get_ppio_client() -> AsyncOpenAI:
+    """Returns the process-wide client for the PPIO OpenAI-compatible endpoint."""
+    return AsyncOpenAI(
+        api_key=os.getenv("PPIO_KEY"),
+        base_url=PPIO_BASE_URL,
+        http_client=_http_client(),
+    )
+
+
+def preload_clients() -> None:
+    """
+    Builds the client this deployment routes through, so the first request
+    does not pay for client construction. Registered as a startup handler.
+    """
+    if USE_PPIO:
+        get_ppio_client()
+    get_openai_client()
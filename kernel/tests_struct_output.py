@@ -1,9 +1,21 @@
-import os
+import asyncio
 import json
-from typing import List, Optional
-from openai import OpenAI
+import logging
+from typing import AsyncIterator, List, Optional
 from pydantic import BaseModel, ValidationError
-from dotenv import load_dotenv
+
+from kernel.openai_client import (
+    OPENAI_API_KEY,
+    USE_PPIO,
+    get_openai_client,
+    get_ppio_client,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class TestRecommendationError(RuntimeError):
+    """Raised when a streamed recommendation request fails partway."""
 
 
 # --- 1. Pydantic Models for Structured Output ---
@@ -20,8 +32,35 @@ class TestRecommendations(BaseModel):
     recommendations: List[Test]
 
 
+# --- The Core Prompt Engineering ---
+_SYSTEM_PROMPT = """
+    You are an expert Clinical Decision Support System (CDSS) assistant that responds in simplified chinese. 
+    Your task is to analyze the following doctor-patient encounter transcription and recommend a set of diagnostic tests.
+
+    **Key Instructions:**
+    1.  **Balance Accuracy and Cost:** The recommendations must balance diagnostic accuracy with resource consumption. Prioritize essential, cost-effective tests that provide the most value for confirming or ruling out likely diagnoses.
+    2.  **Justify Recommendations:** For each test, provide a brief, clear note in the `notes` field explaining *why* it is recommended (e.g., "To rule out acute coronary syndrome", "To check for signs of infection").
+    3.  **Be Concise:** Recommend only the necessary tests for the next step in diagnosis. Do not list every possible test. 
+
+    **Output Format:**
+    You MUST respond with a valid JSON object that strictly adheres to the following Pydantic models. Do not add any explanatory text outside of the JSON structure.
+    """
+
+TESTS_MODEL = "gpt-4o" if not USE_PPIO else "qwen/qwen3-235b-a22b-thinking-2507"
+
+
+def _messages(transcription: str) -> List[dict]:
+    return [
+        {"role": "system", "content": _SYSTEM_PROMPT},
+        {
+            "role": "user",
+            "content": f"Here is the transcription:\n\n---\n{transcription}\n---",
+        },
+    ]
+
+
 # --- 2. Function to Call OpenAI API ---
-def get_test_recommendations(transcription: str) -> Optional[TestRecommendations]:
+async def get_test_recommendations(transcription: str) -> Optional[TestRecommendations]:
     """
     Analyzes a transcription and returns structured test recommendations.
 
@@ -31,71 +70,95 @@ def get_test_recommendations(transcription: str) -> Optional[TestRecommendations
     Returns:
         A Pydantic object with a list of recommended tests, or None on error.
     """
-    # Load API key from .env file
-    load_dotenv()
-    api_key = os.getenv("OPENAI_API_KEY")
-    use_ppio = os.getenv("PPIO", 1)
-    if not api_key:
-        print("Error: OPENAI_API_KEY not found in .env file.")
+    if not OPENAI_API_KEY:
+        logger.error("OPENAI_API_KEY not found in .env file.")
         return None
 
-    if use_ppio:
-        client = OpenAI(api_key=os.getenv("PPIO_KEY"), base_url="https://api.ppinfra.com/v3/openai")
-    else:
-        client = OpenAI(api_key=api_key)
-
-    # --- The Core Prompt Engineering ---
-    system_prompt = f"""
-    You are an expert Clinical Decision Support System (CDSS) assistant that responds in simplified chinese. 
-    Your task is to analyze the following doctor-patient encounter transcription and recommend a set of diagnostic tests.
-
-    **Key Instructions:**
-    1.  **Balance Accuracy and Cost:** The recommendations must balance diagnostic accuracy with resource consumption. Prioritize essential, cost-effective tests that provide the most value for confirming or ruling out likely diagnoses.
-    2.  **Justify Recommendations:** For each test, provide a brief, clear note in the `notes` field explaining *why* it is recommended (e.g., "To rule out acute coronary syndrome", "To check for signs of infection").
-    3.  **Be Concise:** Recommend only the necessary tests for the next step in diagnosis. Do not list every possible test. 
-
-    **Output Format:**
-    You MUST respond with a valid JSON object that strictly adheres to the following Pydantic models. Do not add any explanatory text outside of the JSON structure.
-    """
+    client = get_ppio_client() if USE_PPIO else get_openai_client()
 
     try:
-        print("Requesting test recommendations from OpenAI...")
-        response = client.chat.completions.parse(
-            model="gpt-4o" if not use_ppio else "qwen/qwen3-235b-a22b-thinking-2507",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {
-                    "role": "user",
-                    "content": f"Here is the transcription:\n\n---\n{transcription}\n---",
-                },
-            ],
+        logger.debug("Requesting test recommendations from OpenAI...")
+        response = await client.chat.completions.parse(
+            model=TESTS_MODEL,
+            messages=_messages(transcription),
             response_format=TestRecommendations,  # Enforce JSON output
         )
 
-        response_content = response.choices[0].message.content
-        print("Received raw response from OpenAI.")
+        message = response.choices[0].message
+        logger.debug("Received raw response from OpenAI.")
 
         # --- 3. Parsing and Validation with Pydantic ---
-        # This ensures the AI's output matches our desired structure.
-        parsed_json = json.loads(response_content)
-        validated_recommendations = TestRecommendations.model_validate(parsed_json)
+        # `parse` already validated the content against TestRecommendations.
+        if message.parsed is None:
+            logger.warning("OpenAI did not return recommendations: %s", message.refusal)
+            return None
 
-        print("Successfully parsed and validated the recommendations.")
-        return validated_recommendations
+        logger.debug("Successfully parsed and validated the recommendations.")
+        return message.parsed
 
-    except json.JSONDecodeError:
-        print("Error: Failed to decode JSON from OpenAI response.")
-        print("Raw response:", response_content)
-        return None
-    except ValidationError as e:
-        print("Error: OpenAI response did not match the Pydantic model.")
-        print(e)
+    except (json.JSONDecodeError, ValidationError) as e:
+        logger.error("Error processing OpenAI response: %s", e)
         return None
     except Exception as e:
-        print(f"An unexpected error occurred: {e}")
+        logger.error("An unexpected error occurred: %s", e)
         return None
 
 
+async def stream_test_recommendations(transcription: str) -> AsyncIterator[Test]:
+    """
+    Streams test recommendations, yielding each test as soon as it is complete.
+
+    The structured output is parsed incrementally while the model generates,
+    and a test is emitted once the model has moved on to the next one, so the
+    first recommendation is available long before the full response is.
+
+    Args:
+        transcription: The string transcription of a doctor-patient encounter.
+
+    Yields:
+        Validated Test objects, in the order the model produced them.
+
+    Raises:
+        TestRecommendationError: If the request fails, the model refuses, or
+            its output does not validate. Tests yielded before the failure
+            have already been handed to the caller and are not retracted.
+    """
+    if not OPENAI_API_KEY:
+        logger.error("OPENAI_API_KEY not found in .env file.")
+        raise TestRecommendationError("OPENAI_API_KEY is not configured.")
+
+    client = get_ppio_client() if USE_PPIO else get_openai_client()
+    emitted = 0
+    try:
+        async with client.chat.completions.stream(
+            model=TESTS_MODEL,
+            messages=_messages(transcription),
+            response_format=TestRecommendations,
+        ) as stream:
+            async for event in stream:
+                if event.type != "content.delta" or not isinstance(event.parsed, dict):
+                    continue
+                # Every item but the last is final; the last may still be growing
+                partial = event.parsed.get("recommendations") or []
+                while emitted < len(partial) - 1:
+                    yield Test.model_validate(partial[emitted])
+                    emitted += 1
+            completion = await stream.get_final_completion()
+    except (json.JSONDecodeError, ValidationError) as e:
+        logger.error("Error processing OpenAI response: %s", e)
+        raise TestRecommendationError("Invalid recommendation output.") from e
+    except Exception as e:
+        logger.error("An unexpected error occurred: %s", e)
+        raise TestRecommendationError("Recommendation request failed.") from e
+
+    message = completion.choices[0].message
+    if message.parsed is None:
+        logger.warning("OpenAI did not return recommendations: %s", message.refusal)
+        raise TestRecommendationError("No recommendations were returned.")
+    for test in message.parsed.recommendations[emitted:]:
+        yield test
+
+
 # --- 4. Example Usage ---
 if __name__ == "__main__":
     sample_transcription = """
@@ -108,7 +171,7 @@ if __name__ == "__main__":
     医生: "明白了。我们得尽快做一些检查来确定原因。"
     """
 
-    recommendations = get_test_recommendations(sample_transcription)
+    recommendations = asyncio.run(get_test_recommendations(sample_transcription))
 
     if recommendations:
         print("\n--- Recommended Diagnostic Tests ---")
@@ -0,0 +1,207 @@
+import asyncio
+import io
+import wave
+from collections import deque
+from typing import AsyncIterator, Deque, List, Optional, Tuple
+
+import av
+import numpy as np
+from pydantic import BaseModel
+
+from kernel.openai_client import get_openai_client
+
+SAMPLE_RATE = 16000
+TRANSCRIBE_MODEL = "gpt-4o-mini-transcribe"
+
+
+class TranscriptionResult(BaseModel):
+    """A transcript update for the segment starting at `segment_start` seconds."""
+
+    text: str
+    is_final: bool
+    segment_start: float
+
+
+# Voice activity detection: a frame is voiced when its RMS exceeds the
+# threshold (Int16 units; 328 is about -40 dBFS). Utterances keep some audio
+# from before the first voiced frame so onsets are not clipped, end after a
+# run of silent frames, and are split once they reach the maximum length so
+# long monologues still stream.
+VAD_FRAME_SECONDS = 0.03
+VAD_RMS_THRESHOLD = 328
+PRE_ROLL_SECONDS = 0.2
+HANGOVER_SECONDS = 0.5
+MIN_UTTERANCE_SECONDS = 1.5
+MAX_UTTERANCE_SECONDS = 5.0
+
+
+def decode_webm(audio_bytes: bytes, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """
+    Decodes a WebM/Opus blob into mono Int16 PCM at `sample_rate`.
+
+    Decoding, downmixing and resampling all happen in-process through the
+    FFmpeg bindings, so there is a single pass over the audio and no temporary
+    files, subprocesses or intermediate WAV.
+    """
+    resampler = av.AudioResampler(format="s16", layout="mono", rate=sample_rate)
+    with av.open(io.BytesIO(audio_bytes)) as container:
+        frames = [
+            out
+            for frame in container.decode(audio=0)
+            for out in resampler.resample(frame)
+        ]
+    # Drain the samples the resampler is still buffering
+    frames.extend(resampler.resample(None))
+
+    if not frames:
+        return np.zeros(0, dtype=np.int16)
+    # Packed mono frames are (1, samples); concatenating on axis 1 then
+    # taking row 0 gives a flat view without a further copy
+    return np.concatenate([frame.to_ndarray() for frame in frames], axis=1)[0]
+
+
+def decode_pcm16(audio_bytes: bytes) -> np.ndarray:
+    """
+    Views raw little-endian 16 kHz mono Int16 PCM as a sample array.
+
+    This is the wire format an AudioWorklet client sends and the format the
+    transcription provider receives, so the buffer is used as-is, without
+    a copy.
+    """
+    return np.frombuffer(audio_bytes, dtype="<i2")
+
+
+class _VoiceGate:
+    """
+    Segments a PCM stream into voiced utterances.
+
+    Only utterances come out of the gate, so silence never reaches the
+    transcription provider, and utterances shorter than MIN_UTTERANCE_SECONDS
+    (coughs, clicks, stray noise) are dropped as well.
+    """
+
+    def __init__(self, sample_rate: int):
+        self._sample_rate = sample_rate
+        self._frame = int(VAD_FRAME_SECONDS * sample_rate)
+        self._hangover_frames = int(HANGOVER_SECONDS / VAD_FRAME_SECONDS)
+        self._max_frames = int(MAX_UTTERANCE_SECONDS / VAD_FRAME_SECONDS)
+        self._pre_roll: Deque[np.ndarray] = deque(
+            maxlen=int(PRE_ROLL_SECONDS / VAD_FRAME_SECONDS)
+        )
+        self._remainder = np.zeros(0, dtype=np.int16)
+        self._in_utterance = False
+        self._continued = False
+        self._utterance: List[np.ndarray] = []
+        self._utterance_start = 0
+        self._silent_frames = 0
+        self._position = 0
+
+    def feed(self, pcm: np.ndarray) -> List[Tuple[float, np.ndarray]]:
+        """Returns the `(start_seconds, pcm)` utterances completed by `pcm`."""
+        data = np.concatenate((self._remainder, pcm))
+        count = len(data) // self._frame
+        frames = data[: count * self._frame].reshape(count, self._frame)
+        self._remainder = data[count * self._frame:]
+        # Per-frame mean square, accumulated in float64 so Int16 squares cannot
+        # overflow, without materializing frames ** 2
+        voiced = (
+            np.einsum("ij,ij->i", frames, frames, dtype=np.float64) / self._frame
+            > VAD_RMS_THRESHOLD ** 2
+        )
+
+        completed = []
+        for frame, is_voiced in zip(frames, voiced):
+            position = self._position
+            self._position += self._frame
+            if self._in_utterance:
+                self._utterance.append(frame)
+                self._silent_frames = 0 if is_voiced else self._silent_frames + 1
+                if self._silent_frames >= self._hangover_frames:
+                    completed.extend(self.flush())
+                elif len(self._utterance) >= self._max_frames:
+                    completed.append(self._split())
+            elif is_voiced:
+                self._in_utterance = True
+                self._utterance = [*self._pre_roll, frame]
+                self._utterance_start = position - len(self._pre_roll) * self._frame
+                self._pre_roll.clear()
+                self._silent_frames = 0
+            else:
+                self._pre_roll.append(frame)
+        return completed
+
+    def _split(self) -> Tuple[float, np.ndarray]:
+        # Emit what we have and keep the utterance open for the speech that
+        # follows; the tail is kept later even if it is short
+        segment = self._utterance_start / self._sample_rate, np.concatenate(
+            self._utterance
+        )
+        self._utterance = []
+        self._utterance_start = self._position
+        self._continued = True
+        return segment
+
+    def flush(self) -> List[Tuple[float, np.ndarray]]:
+        """Closes the utterance in progress, if it is long enough to keep."""
+        utterance, self._utterance = self._utterance, []
+        continued, self._continued = self._continued, False
+        self._in_utterance = False
+        if not utterance or (
+            not continued
+            and len(utterance) * self._frame < MIN_UTTERANCE_SECONDS * self._sample_rate
+        ):
+            return []
+        return [(self._utterance_start / self._sample_rate, np.concatenate(utterance))]
+
+
+def _to_wav(pcm: np.ndarray, sample_rate: int) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm.astype("<i2", copy=False).tobytes())
+    return buffer.getvalue()
+
+
+async def _transcribe_segment(
+    pcm: np.ndarray, segment_start: float, sample_rate: int
+) -> AsyncIterator[TranscriptionResult]:
+    stream = await get_openai_client().audio.transcriptions.create(
+        model=TRANSCRIBE_MODEL,
+        file=("segment.wav", _to_wav(pcm, sample_rate), "audio/wav"),
+        stream=True,
+    )
+    text = ""
+    async for event in stream:
+        if event.type == "transcript.text.delta":
+            text += event.delta
+            yield TranscriptionResult(
+                text=text, is_final=False, segment_start=segment_start
+            )
+        elif event.type == "transcript.text.done":
+            yield TranscriptionResult(
+                text=event.text, is_final=True, segment_start=segment_start
+            )
+
+
+async def transcribe_stream(
+    chunks: "asyncio.Queue[Optional[np.ndarray]]", sample_rate: int = SAMPLE_RATE
+) -> AsyncIterator[TranscriptionResult]:
+    """
+    Transcribes Int16 PCM chunks from `chunks` until a None sentinel arrives.
+
+    Chunks pass through a voice activity gate, and each voiced utterance is
+    sent to a streaming transcription request. Its text is yielded as a
+    growing partial result followed by a final one. Producers keep filling the
+    queue meanwhile, so the next utterance is ready when this one completes.
+    """
+    gate = _VoiceGate(sample_rate)
+    while True:
+        chunk = await chunks.get()
+        utterances = gate.feed(chunk) if chunk is not None else gate.flush()
+        for segment_start, segment in utterances:
+            async for result in _transcribe_segment(segment, segment_start, sample_rate):
+                yield result
+        if chunk is None:
+            return
@@ -1,7 +1,14 @@
-import numpy as np
-from fastapi import FastAPI, WebSocket
+import asyncio
+import logging
+
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+import settings
 from database import close_mongo_connection, connect_to_mongo
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipResponder
 
 # Import all EHR routers
 from routers.ehr import (
@@ -33,12 +40,51 @@ from routers.intelligence import (
     dialog_router,
 )
 
+from kernel.openai_client import preload_clients
+from kernel.transcribe import decode_pcm16, decode_webm, transcribe_stream
+
+logging.basicConfig(level=settings.LOG_LEVEL)
+
 app = FastAPI(
     title="EHR System API",
     description="A comprehensive Electronic Health Records system with CRUD operations",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
+class _GZipResponder(GZipResponder):
+    """Passes server-sent event streams through uncompressed.
+
+    Gzip would buffer the events until the stream closes, so the decision is
+    made on the response's content type once its headers are sent.
+    """
+
+    _passthrough = False
+
+    async def send_with_gzip(self, message):
+        if message["type"] == "http.response.start":
+            content_type = Headers(raw=message["headers"]).get("content-type", "")
+            self._passthrough = content_type.startswith("text/event-stream")
+        if self._passthrough:
+            await self.send(message)
+        else:
+            await super().send_with_gzip(message)
+
+
+class _GZipMiddleware(GZipMiddleware):
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and "gzip" in Headers(scope=scope).get(
+            "Accept-Encoding", ""
+        ):
+            responder = _GZipResponder(
+                self.app, self.minimum_size, compresslevel=self.compresslevel
+            )
+            await responder(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+app.add_middleware(_GZipMiddleware, minimum_size=1024)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -48,6 +94,7 @@ app.add_middleware(
 )
 
 app.add_event_handler("startup", connect_to_mongo)
+app.add_event_handler("startup", preload_clients)
 app.add_event_handler("shutdown", close_mongo_connection)
 
 # Include all EHR routers
@@ -133,22 +180,81 @@ async def health_check():
     return {"status": "healthy", "service": "EHR API"}
 
 
+# Decoded chunks waiting for the transcriber. About 25 s of 100 ms PCM chunks;
+# when the provider falls further behind, the oldest audio is dropped.
+TRANSCRIBE_QUEUE_CHUNKS = 256
+
+logger = logging.getLogger(__name__)
+
+
 @app.websocket("/ws/transcribe")
-async def websocket_transcription(websocket: WebSocket):
+async def websocket_transcription(websocket: WebSocket, encoding: str = "webm"):
+    """
+    Transcribes audio streamed by the client.
+
+    Replies are JSON frames of the form
+    `{"text": ..., "is_final": ..., "segment_start": ...}`: partial frames
+    carry the growing text of the current segment, and a final frame closes it.
+
+    Clients capturing with an AudioWorklet should connect with
+    `?encoding=pcm16` and send raw 16 kHz mono Int16 PCM, which skips
+    container decoding entirely; MediaRecorder WebM/Opus chunks remain the
+    default for existing clients.
+    """
     await websocket.accept()
-    print("socket received")
+    logger.debug("Transcription socket accepted (encoding=%s)", encoding)
+
+    # Receiving runs in its own task so the client's next chunk is read while
+    # the current segment is still being transcribed, rather than after it.
+    chunks: asyncio.Queue = asyncio.Queue(maxsize=TRANSCRIBE_QUEUE_CHUNKS)
+
+    def enqueue(chunk):
+        if chunks.full():
+            chunks.get_nowait()
+            logger.warning("Transcription is falling behind; dropped oldest chunk")
+        chunks.put_nowait(chunk)
+
+    async def receive_chunks():
+        try:
+            while True:
+                audio_data = await websocket.receive_bytes()
+                try:
+                    if encoding == "pcm16":
+                        pcm = decode_pcm16(audio_data)
+                    else:
+                        # FFmpeg decoding is CPU-bound; keep it off the event loop
+                        pcm = await asyncio.to_thread(decode_webm, audio_data)
+                except Exception as e:
+                    # One bad chunk should not end the session
+                    logger.warning(
+                        "Dropping undecodable %s chunk (%d bytes): %s",
+                        encoding,
+                        len(audio_data),
+                        e,
+                    )
+                    continue
+                enqueue(pcm)
+        except WebSocketDisconnect:
+            pass
+        finally:
+            enqueue(None)
 
-    while True:
-        audio_data = await websocket.receive_bytes()
-        print(type(audio_data))
-        audio_array = webm_to_librosa_temp(audio_data)
-        ai_response = await forward_to_ai_provider(
-            audio_array.astype(np.float32).tobytes()
-        )
-        await websocket.send_text(ai_response)
+    receiver = asyncio.ensure_future(receive_chunks())
+    try:
+        async for result in transcribe_stream(chunks):
+            await websocket.send_json(result.model_dump())
+    finally:
+        receiver.cancel()
 
 
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8080)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8080,
+        workers=settings.UVICORN_WORKERS,
+        loop="uvloop",
+        http="httptools",
+    )
@@ -4,6 +4,7 @@ This file contains mock cases, tests, medicines, diagnoses, and treatments for 2
 """
 
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
 from bson import ObjectId
 from models.dianosis_models import Case, Test, Medicine, Diagnosis, Treatment
 import random
@@ -43,13 +44,6 @@ A: Inflammatory arthritis, rule out rheumatoid arthritis
 P: RF, anti-CCP, ESR, CRP, CBC, rheumatology referral, NSAIDs""",
 ]
 
-# Generate mock cases for 20 patients
-MOCK_CASES = []
-MOCK_TESTS = []
-MOCK_MEDICINES = []
-MOCK_DIAGNOSES = []
-MOCK_TREATMENTS = []
-
 # Medical conditions with associated tests, medicines, diagnoses, and treatments
 CONDITIONS = [
     {
@@ -200,140 +194,174 @@ CONDITIONS = [
     },
 ]
 
-# Generate data for 20 patients
-for i in range(1, 21):
-    patient_id = generate_patient_id(i)
-
-    # Each patient gets 1-3 cases
-    num_cases = random.randint(1, 3)
-
-    for case_num in range(num_cases):
-        case_id = generate_object_id()
-        case_number = (
-            generate_object_id()
-        )  # Using ObjectId for case number as requested
-
-        # Select a random condition
-        condition = random.choice(CONDITIONS)
-
-        # Create case
-        case_date = datetime.now(timezone.utc) - timedelta(days=random.randint(1, 90))
-
-        case = Case(
-            _id=case_id,
-            patient_id=patient_id,
-            case_number=case_number,
-            soap=condition["soap"],
-            case_date=case_date,
-            transcriptions=f"Audio transcription for case {case_number} - patient reported symptoms clearly",
-            status=condition["status"],
-            notes=f"Additional notes for patient {patient_id}, case {case_num + 1}",
-            created_at=case_date,
-            updated_at=case_date + timedelta(hours=random.randint(1, 48)),
-        )
-        MOCK_CASES.append(case)
-
-        # Create tests for this case
-        for test_name in condition["tests"]:
-            test_id = generate_object_id()
-            test_date = case_date + timedelta(hours=random.randint(1, 24))
-
-            # Generate mock test results
-            test_results = []
-            if test_name == "ECG":
-                test_results = [
-                    {"rhythm": "sinus", "rate": "88", "intervals": "normal"}
-                ]
-            elif "Glucose" in test_name:
-                test_results = [{"value": random.randint(80, 300), "unit": "mg/dL"}]
-            elif test_name in ["CBC", "CMP"]:
-                test_results = [
-                    {"wbc": "8.5", "rbc": "4.2", "hgb": "13.5", "hct": "40.2"}
-                ]
-            else:
-                test_results = [{"result": "pending", "status": "in_progress"}]
-
-            test = Test(
-                _id=test_id,
-                case_id=case_id,
-                patient_id=patient_id,
-                test_name=test_name,
-                test_date=test_date,
-                notes=f"Test ordered for {test_name}",
-                results=test_results,
-                created_at=test_date,
-                updated_at=test_date + timedelta(hours=2),
-            )
-            MOCK_TESTS.append(test)
 
-        # Create medicines for this case
-        for med_info in condition["medicines"]:
-            medicine_id = generate_object_id()
-            start_date = case_date + timedelta(hours=random.randint(2, 12))
+@lru_cache(maxsize=1)
+def _build():
+    """Generates the mock data on first use rather than at import time."""
+    MOCK_CASES = []
+    MOCK_TESTS = []
+    MOCK_MEDICINES = []
+    MOCK_DIAGNOSES = []
+    MOCK_TREATMENTS = []
 
-            medicine = Medicine(
-                _id=medicine_id,
-                case_id=case_id,
-                patient_id=patient_id,
-                medicine_name=med_info["name"],
-                dosage=med_info["dosage"],
-                route=med_info["route"],
-                frequency=med_info["frequency"],
-                start_date=start_date,
-                end_date=start_date + timedelta(days=random.randint(7, 30))
-                if condition["status"] == "closed"
-                else None,
-                notes=f"Prescribed for {med_info['name']} therapy",
-                created_at=start_date,
-                updated_at=start_date + timedelta(hours=1),
-            )
-            MOCK_MEDICINES.append(medicine)
+    # Every case date is offset from the same instant
+    now = datetime.now(timezone.utc)
 
-        # Create diagnoses for this case
-        for diag_info in condition["diagnoses"]:
-            diagnosis_id = generate_object_id()
-            diagnosis_date = case_date + timedelta(hours=random.randint(4, 24))
+    # Generate data for 20 patients
+    for i in range(1, 21):
+        patient_id = generate_patient_id(i)
 
-            diagnosis = Diagnosis(
-                _id=diagnosis_id,
-                case_id=case_id,
-                patient_id=patient_id,
-                diagnosis_name=diag_info["name"],
-                diagnosis_date=diagnosis_date,
-                status=diag_info["status"],
-                probability=diag_info["probability"],
-                notes=f"Diagnosis based on clinical presentation and test results",
-                follow_up="Follow up in 1-2 weeks or as needed",
-                additional_info=f"Confidence level: {diag_info['probability']*100:.0f}%",
-                created_at=diagnosis_date,
-                updated_at=diagnosis_date + timedelta(hours=2),
-            )
-            MOCK_DIAGNOSES.append(diagnosis)
+        # Each patient gets 1-3 cases
+        num_cases = random.randint(1, 3)
 
-        # Create treatments for this case
-        for treat_info in condition["treatments"]:
-            treatment_id = generate_object_id()
-            treatment_date = case_date + timedelta(hours=random.randint(6, 48))
+        for case_num in range(num_cases):
+            case_id = generate_object_id()
+            case_number = (
+                generate_object_id()
+            )  # Using ObjectId for case number as requested
 
-            treatment = Treatment(
-                _id=treatment_id,
-                case_id=case_id,
+            # Select a random condition
+            condition = random.choice(CONDITIONS)
+
+            # Create case
+            case_date = now - timedelta(days=random.randint(1, 90))
+
+            case = Case(
+                _id=case_id,
                 patient_id=patient_id,
-                treatment_name=treat_info["name"],
-                treatment_date=treatment_date,
-                treatment_type=treat_info["type"],
-                outcome="Ongoing" if condition["status"] != "closed" else "Improved",
-                notes=f"Treatment plan: {treat_info['name']}",
-                created_at=treatment_date,
-                updated_at=treatment_date + timedelta(hours=4),
+                case_number=case_number,
+                soap=condition["soap"],
+                case_date=case_date,
+                transcriptions=f"Audio transcription for case {case_number} - patient reported symptoms clearly",
+                status=condition["status"],
+                notes=f"Additional notes for patient {patient_id}, case {case_num + 1}",
+                created_at=case_date,
+                updated_at=case_date + timedelta(hours=random.randint(1, 48)),
             )
-            MOCK_TREATMENTS.append(treatment)
-
-# Summary of generated data
-print(f"Generated mock data:")
-print(f"- {len(MOCK_CASES)} cases")
-print(f"- {len(MOCK_TESTS)} tests")
-print(f"- {len(MOCK_MEDICINES)} medicines")
-print(f"- {len(MOCK_DIAGNOSES)} diagnoses")
-print(f"- {len(MOCK_TREATMENTS)} treatments")
-print(f"For patients: {', '.join([generate_patient_id(i) for i in range(1, 21)])}")
+            MOCK_CASES.append(case)
+
+            # Create tests for this case
+            for test_name in condition["tests"]:
+                test_id = generate_object_id()
+                test_date = case_date + timedelta(hours=random.randint(1, 24))
+
+                # Generate mock test results
+                test_results = []
+                if test_name == "ECG":
+                    test_results = [
+                        {"rhythm": "sinus", "rate": "88", "intervals": "normal"}
+                    ]
+                elif "Glucose" in test_name:
+                    test_results = [{"value": random.randint(80, 300), "unit": "mg/dL"}]
+                elif test_name in ["CBC", "CMP"]:
+                    test_results = [
+                        {"wbc": "8.5", "rbc": "4.2", "hgb": "13.5", "hct": "40.2"}
+                    ]
+                else:
+                    test_results = [{"result": "pending", "status": "in_progress"}]
+
+                test = Test(
+                    _id=test_id,
+                    case_id=case_id,
+                    patient_id=patient_id,
+                    test_name=test_name,
+                    test_date=test_date,
+                    notes=f"Test ordered for {test_name}",
+                    results=test_results,
+                    created_at=test_date,
+                    updated_at=test_date + timedelta(hours=2),
+                )
+                MOCK_TESTS.append(test)
+
+            # Create medicines for this case
+            for med_info in condition["medicines"]:
+                medicine_id = generate_object_id()
+                start_date = case_date + timedelta(hours=random.randint(2, 12))
+
+                medicine = Medicine(
+                    _id=medicine_id,
+                    case_id=case_id,
+                    patient_id=patient_id,
+                    medicine_name=med_info["name"],
+                    dosage=med_info["dosage"],
+                    route=med_info["route"],
+                    frequency=med_info["frequency"],
+                    start_date=start_date,
+                    end_date=start_date + timedelta(days=random.randint(7, 30))
+                    if condition["status"] == "closed"
+                    else None,
+                    notes=f"Prescribed for {med_info['name']} therapy",
+                    created_at=start_date,
+                    updated_at=start_date + timedelta(hours=1),
+                )
+                MOCK_MEDICINES.append(medicine)
+
+            # Create diagnoses for this case
+            for diag_info in condition["diagnoses"]:
+                diagnosis_id = generate_object_id()
+                diagnosis_date = case_date + timedelta(hours=random.randint(4, 24))
+
+                diagnosis = Diagnosis(
+                    _id=diagnosis_id,
+                    case_id=case_id,
+                    patient_id=patient_id,
+                    diagnosis_name=diag_info["name"],
+                    diagnosis_date=diagnosis_date,
+                    status=diag_info["status"],
+                    probability=diag_info["probability"],
+                    notes=f"Diagnosis based on clinical presentation and test results",
+                    follow_up="Follow up in 1-2 weeks or as needed",
+                    additional_info=f"Confidence level: {diag_info['probability']*100:.0f}%",
+                    created_at=diagnosis_date,
+                    updated_at=diagnosis_date + timedelta(hours=2),
+                )
+                MOCK_DIAGNOSES.append(diagnosis)
+
+            # Create treatments for this case
+            for treat_info in condition["treatments"]:
+                treatment_id = generate_object_id()
+                treatment_date = case_date + timedelta(hours=random.randint(6, 48))
+
+                treatment = Treatment(
+                    _id=treatment_id,
+                    case_id=case_id,
+                    patient_id=patient_id,
+                    treatment_name=treat_info["name"],
+                    treatment_date=treatment_date,
+                    treatment_type=treat_info["type"],
+                    outcome="Ongoing" if condition["status"] != "closed" else "Improved",
+                    notes=f"Treatment plan: {treat_info['name']}",
+                    created_at=treatment_date,
+                    updated_at=treatment_date + timedelta(hours=4),
+                )
+                MOCK_TREATMENTS.append(treatment)
+
+    return MOCK_CASES, MOCK_TESTS, MOCK_MEDICINES, MOCK_DIAGNOSES, MOCK_TREATMENTS
+
+
+_MOCK_DATA_NAMES = (
+    "MOCK_CASES",
+    "MOCK_TESTS",
+    "MOCK_MEDICINES",
+    "MOCK_DIAGNOSES",
+    "MOCK_TREATMENTS",
+)
+
+
+def __getattr__(name):
+    # Keeps `from mock_diagnosis_data import MOCK_CASES` working
+    if name in _MOCK_DATA_NAMES:
+        return _build()[_MOCK_DATA_NAMES.index(name)]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if __name__ == "__main__":
+    # Summary of generated data
+    MOCK_CASES, MOCK_TESTS, MOCK_MEDICINES, MOCK_DIAGNOSES, MOCK_TREATMENTS = _build()
+    print(f"Generated mock data:")
+    print(f"- {len(MOCK_CASES)} cases")
+    print(f"- {len(MOCK_TESTS)} tests")
+    print(f"- {len(MOCK_MEDICINES)} medicines")
+    print(f"- {len(MOCK_DIAGNOSES)} diagnoses")
+    print(f"- {len(MOCK_TREATMENTS)} treatments")
+    print(f"For patients: {', '.join([generate_patient_id(i) for i in range(1, 21)])}")
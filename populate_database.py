@@ -19,7 +19,7 @@ from services.ehr_service import (
     social_history_service,
     vital_signs_service,
 )
-from mock_patient_data import MOCK_PATIENTS
+from mock_patient_data import MOCK_PATIENTS, validate_mock_patients
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -29,6 +29,9 @@ logger = logging.getLogger(__name__)
 async def populate_database():
     """Populate the database with mock patient data."""
     try:
+        # The mocks skip validation when built; check them before writing
+        validate_mock_patients()
+
         # Connect to database
         await connect_to_mongo()
         logger.info("Connected to MongoDB")
@@ -1,3 +0,0 @@
-from openai import OpenAI
-
-client = OpenAI()
@@ -1,10 +1,13 @@
+import json
+
 from pydantic import BaseModel
 from kernel.chat_output import (
-    get_ai_chat_response, continue_dialogue,
+    DialogueStreamError, get_ai_chat_response, continue_dialogue, stream_dialogue,
 )
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from database import db
-from kernel.decision import summarize_user_data
+from kernel.decision import CaseDataNotFound, get_patient_summary
 
 router = APIRouter()
 
@@ -16,7 +19,10 @@ async def initiate_dialogue(case_id: str):
     :param case_id: The ID of the case for which the dialogue is being initiated.
     :return: The conversation ID.
     """
-    patient_summary = await summarize_user_data(case_id)
+    try:
+        patient_summary = await get_patient_summary(case_id)
+    except CaseDataNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
 
     # Here you would typically start a new conversation in your dialogue system
     id, result = await get_ai_chat_response(
@@ -48,6 +54,30 @@ async def continue_dialogue_(conversation_id: str, input_data: UserInputData):
     }
 
 
+@router.post("/dialogues/{conversation_id}/continuation/stream")
+async def stream_dialogue_(conversation_id: str, input_data: UserInputData):
+    """
+    Continue a dialogue with user input, streaming the reply as server-sent events.
+    :param conversation_id: The ID of the conversation to continue.
+    :param user_input: The input from the user to continue the dialogue.
+    :return: An event stream with one `data` event per reply fragment. If the
+        model call fails, an `error` event ends the stream.
+    """
+    stream = await stream_dialogue(conversation_id, input_data.user_input)
+    if stream is None:
+        raise HTTPException(status_code=404, detail="Conversation not found.")
+
+    async def events():
+        try:
+            async for delta in stream:
+                # Multi-line fragments need one `data:` field per line
+                yield "".join(f"data: {line}\n" for line in delta.split("\n")) + "\n"
+        except DialogueStreamError as e:
+            yield f"event: error\ndata: {json.dumps({'detail': str(e)})}\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
 @router.get("/dialogues/{conversation_id}")
 async def get_dialogue(conversation_id: str):
     """
@@ -1,12 +1,19 @@
+import json
 from datetime import datetime, timezone
 
 from bson import ObjectId
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from database import db
-from kernel.decision import summarize_user_data
+from kernel.decision import CaseDataNotFound, get_patient_summary
 from kernel.diagnosis_treatment_output import generate_clinical_plan
-from kernel.tests_struct_output import get_test_recommendations
+from kernel.tests_struct_output import (
+    TestRecommendationError,
+    get_test_recommendations,
+    stream_test_recommendations,
+)
 from models.dianosis_models import Test, Diagnosis, Medicine, Treatment
+from services.summary_cache import invalidate_patient_summaries
 
 router = APIRouter()
 
@@ -23,7 +30,10 @@ async def get_recommended_tests(case_id: str):
     )
     if not transcript:
         return {"message": "No transcription found for the given case ID."}
-    recommends = get_test_recommendations(transcript["text"])
+    case = await db.cdss.get_collection("cases").find_one({"_id": ObjectId(case_id)})
+    if not case:
+        raise HTTPException(status_code=404, detail="Case not found.")
+    recommends = await get_test_recommendations(transcript["text"])
     for recommendation in recommends.recommendations:
         if not recommendation.test_name:
             continue
@@ -31,18 +41,65 @@ async def get_recommended_tests(case_id: str):
             Test(
                 _id="",
                 case_id=case_id,
-                patient_id=(await db.cdss.get_collection("cases").find_one(
-                    {"_id": ObjectId(case_id)}
-                ))["patient_id"],
+                patient_id=case["patient_id"],
                 test_name=recommendation.test_name,
                 test_date=datetime.now(timezone.utc),
                 notes=recommendation.notes,
                 results=[],
             ).model_dump()
         )
+    # Summaries join tests by patient, so every case of this patient is stale
+    invalidate_patient_summaries(patient_id=case["patient_id"])
     return len(recommends.recommendations)
 
 
+@router.post("/{case_id}/tests/stream")
+async def stream_recommended_tests(case_id: str):
+    """
+    Get recommended tests for a specific case, streamed as server-sent events.
+    Each test is saved and sent as soon as the model finishes generating it.
+    If generation fails partway, an `error` event ends the stream; tests sent
+    before it have already been saved and are kept.
+    """
+    transcript = await db.cdss.get_collection("transcriptions").find_one(
+        {"case_id": case_id}
+    )
+    if not transcript:
+        raise HTTPException(
+            status_code=404, detail="No transcription found for the given case ID."
+        )
+    case = await db.cdss.get_collection("cases").find_one({"_id": ObjectId(case_id)})
+    if not case:
+        raise HTTPException(status_code=404, detail="Case not found.")
+
+    async def events():
+        saved = 0
+        try:
+            async for recommendation in stream_test_recommendations(transcript["text"]):
+                if not recommendation.test_name:
+                    continue
+                await db.cdss.get_collection("tests").insert_one(
+                    Test(
+                        _id="",
+                        case_id=case_id,
+                        patient_id=case["patient_id"],
+                        test_name=recommendation.test_name,
+                        test_date=datetime.now(timezone.utc),
+                        notes=recommendation.notes,
+                        results=[],
+                    ).model_dump()
+                )
+                saved += 1
+                yield f"data: {recommendation.model_dump_json()}\n\n"
+        except TestRecommendationError as e:
+            yield f"event: error\ndata: {json.dumps({'detail': str(e)})}\n\n"
+        finally:
+            if saved:
+                invalidate_patient_summaries(patient_id=case["patient_id"])
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
 
 @router.post("/{case_id}/treatments")
 async def get_recommended_treatments(case_id: str):
@@ -51,8 +108,11 @@ async def get_recommended_treatments(case_id: str):
     This endpoint retrieves treatments that are recommended based on the case ID.
     """
     # Placeholder for actual implementation
-    data = await summarize_user_data(case_id)
-    recommendations = generate_clinical_plan(data)
+    try:
+        data = await get_patient_summary(case_id)
+    except CaseDataNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    recommendations = await generate_clinical_plan(data)
     print(recommendations)
     diagnosis = Diagnosis(
         _id="",
@@ -94,5 +154,6 @@ async def get_recommended_treatments(case_id: str):
                 notes=treatment.notes,
             ).model_dump()
         )
+    invalidate_patient_summaries(patient_id=data.patient_info.get("id"))
     return [1, len(recommendations.medication_plan), len(recommendations.other_treatments)]
 
@@ -1,10 +1,13 @@
+import asyncio
 import json
 from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
 from fastapi import APIRouter
 from pydantic import BaseModel
 
 from database import db
-import openai
+from services.summary_cache import invalidate_patient_summaries
+from kernel.openai_client import get_openai_client
 
 
 router = APIRouter()
@@ -20,41 +23,90 @@ class ResponseFormatSummarization(BaseModel):
     other_relevant_info: str
 
 
-async def summarize_transcription(text: str):
-    """
-    Summarizes the transcription text.
-    This function should implement the logic to summarize the transcription.
-    """
-    prompt = f"""You are a clinical experts who are summarizing the conversation between a patient and a doctor.
+# Static instructions come first and are byte-identical across calls, so the
+# provider's prompt-prefix cache can reuse them as the transcript grows.
+SUMMARIZATION_PROMPT = """You are a clinical experts who are summarizing the conversation between a patient and a doctor.
 The patient is describing their symptoms and the doctor is asking questions to understand the patient's condition.
 Please note that the transcription and summarization is continuous, so you should summarize the conversation as it progresses.
 We could not tell patient and physician apart, so you should summarize the conversation as a whole.
 Your output language should be the same as the input language.
 You should contain user's chief complaint, history of present illness, and any other relevant information.
 """
-    response = openai.chat.completions.parse(
+
+
+async def summarize_transcription(text: str, case_id: str):
+    """
+    Summarizes the transcription text.
+    This function should implement the logic to summarize the transcription.
+    """
+    response = await get_openai_client().chat.completions.parse(
         model="gpt-4o",
         messages=[
-            {"role": "system", "content": prompt},
+            {"role": "system", "content": SUMMARIZATION_PROMPT},
             {"role": "user", "content": text},
         ],
-        response_format=ResponseFormatSummarization
+        response_format=ResponseFormatSummarization,
+        temperature=0,
+        # Route every call for a case to the same cache shard; consecutive
+        # calls share the instructions plus all previously saved transcript.
+        extra_body={"prompt_cache_key": f"transcription:{case_id}"},
     )
     return response.choices[0].message.content
 
 
-
-@router.post("/{case_id}/incremental")
-async def save_transcription(case_id: str, save_request: SaveTranscriptionRequest):
+class _TranscriptCoalescer:
     """
-    Initiate a dialogue for a specific case.
-    This endpoint can be used to start a conversation with an AI provider.
+    Serializes incremental saves per case and merges the ones that queue up.
+
+    Saves for a case are applied one at a time, so the read/summarize/replace
+    sequence never interleaves with itself. Texts that arrive while a save is
+    in flight are appended to a single pending batch and summarized together
+    once it finishes, instead of costing one summarization call each.
     """
+
+    def __init__(self):
+        self._pending: Dict[str, Tuple[List[str], asyncio.Future]] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    async def save(self, case_id: str, text: str) -> None:
+        batch = self._pending.get(case_id)
+        if batch is None:
+            future = asyncio.get_running_loop().create_future()
+            batch = self._pending[case_id] = ([], future)
+            previous = self._inflight.get(case_id)
+            self._inflight[case_id] = asyncio.ensure_future(
+                self._flush(case_id, batch, previous)
+            )
+        batch[0].append(text)
+        await asyncio.shield(batch[1])
+
+    async def _flush(
+        self,
+        case_id: str,
+        batch: Tuple[List[str], asyncio.Future],
+        previous: Optional[asyncio.Task],
+    ) -> None:
+        if previous is not None:
+            await asyncio.wait([previous])
+        # From here on, new texts start the next batch
+        del self._pending[case_id]
+        texts, future = batch
+        try:
+            await _replace_transcription(case_id, "\n".join(texts))
+            future.set_result(None)
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            if self._inflight.get(case_id) is asyncio.current_task():
+                del self._inflight[case_id]
+
+
+async def _replace_transcription(case_id: str, text: str) -> None:
     base = ""
     for already in (await db.cdss.get_collection("transcriptions").find({"case_id": case_id}).to_list(None)):
         base += already["text"] + "\n"
-    save_request.text = base + save_request.text
-    structured = await summarize_transcription(save_request.text)
+    text = base + text
+    structured = await summarize_transcription(text, case_id)
     await db.cdss.get_collection("transcriptions").delete_many({"case_id": case_id})
     try:
         structured = json.loads(structured)
@@ -66,9 +118,23 @@ async def save_transcription(case_id: str, save_request: SaveTranscriptionReques
         }
     await db.cdss.get_collection("transcriptions").insert_one({
         "case_id": case_id,
-        "text": save_request.text,
+        "text": text,
         "created_at": datetime.now(timezone.utc),
         **structured,
     })
 
+    invalidate_patient_summaries(case_id=case_id)
+
+
+_transcript_coalescer = _TranscriptCoalescer()
+
+
+@router.post("/{case_id}/incremental")
+async def save_transcription(case_id: str, save_request: SaveTranscriptionRequest):
+    """
+    Initiate a dialogue for a specific case.
+    This endpoint can be used to start a conversation with an AI provider.
+    """
+    await _transcript_coalescer.save(case_id, save_request.text)
+
     return {"message": "Transcription saved successfully."}
@@ -1,7 +1,9 @@
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ReturnDocument
 from models.ehr_models import *
 from database import db
+from services.summary_cache import invalidate_patient_summaries
 from datetime import datetime, timezone
 
 
@@ -26,6 +28,7 @@ class EHRService:
         data["updated_at"] = datetime.now(timezone.utc)
 
         await self.collection.insert_one(data)
+        invalidate_patient_summaries(patient_id=data.get("patient_id"))
         created_record = await self.collection.find_one({"_id": data["_id"]})
         return created_record
 
@@ -50,14 +53,30 @@ class EHRService:
         # Remove None values and _id from update data
         update_data = {k: v for k, v in data.items() if v is not None and k != "_id"}
 
-        await self.collection.update_one({"_id": record_id}, {"$set": update_data})
+        # The pre-image tells us which patient's cached summaries are stale,
+        # including the old patient when the patch moves the record
+        previous = await self.collection.find_one_and_update(
+            {"_id": record_id},
+            {"$set": update_data},
+            projection={"patient_id": 1},
+            return_document=ReturnDocument.BEFORE,
+        )
+        if previous is not None:
+            invalidate_patient_summaries(patient_id=previous.get("patient_id"))
+            if "patient_id" in update_data:
+                invalidate_patient_summaries(patient_id=update_data["patient_id"])
 
         return await self.collection.find_one({"_id": record_id})
 
     async def delete(self, record_id: str) -> bool:
         """Delete a record"""
-        result = await self.collection.delete_one({"_id": record_id})
-        return result.deleted_count > 0
+        deleted = await self.collection.find_one_and_delete(
+            {"_id": record_id}, projection={"patient_id": 1}
+        )
+        if deleted is None:
+            return False
+        invalidate_patient_summaries(patient_id=deleted.get("patient_id"))
+        return True
 
     async def search(self, query: dict, skip: int = 0, limit: int = 100) -> List[dict]:
         """Search records based on query"""
@@ -0,0 +1,97 @@
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+# Patient summaries are reused across chat turns on the same case. Entries
+# expire after SUMMARY_TTL_SECONDS and are dropped early by the write paths
+# whenever the patient's records change.
+#
+# The cache is per process. With UVICORN_WORKERS > 1 an invalidation only
+# reaches the worker that handled the write; the others keep serving their
+# copy until it expires.
+SUMMARY_TTL_SECONDS = 60
+SUMMARY_CACHE_SIZE = 1024
+
+# case_id -> (expires_at, patient_id, summary)
+_summary_cache: "OrderedDict[str, Tuple[float, Optional[str], Any]]" = OrderedDict()
+
+# A load that started before an invalidation of its case or patient must not
+# store what it read. Invalidations bump a generation counter and stamp the
+# keys they touch with it; "case:<id>" / "patient:<id>" -> latest stamp.
+_generation = 0
+_invalidated_at: "OrderedDict[str, int]" = OrderedDict()
+# Stamps evicted from _invalidated_at are no longer checked individually, so
+# loads older than the newest evicted stamp are treated as stale.
+_forgotten_through = 0
+
+
+def get_cached_summary(case_id: str) -> Optional[Any]:
+    """Returns the cached summary for a case, or None if absent or expired."""
+    entry = _summary_cache.get(case_id)
+    if entry is None:
+        return None
+    expires_at, _, summary = entry
+    if expires_at < time.monotonic():
+        del _summary_cache[case_id]
+        return None
+    return summary
+
+
+def summary_generation() -> int:
+    """Returns the generation to pass to cache_summary for a load starting now."""
+    return _generation
+
+
+def _invalidated_since(key: str, generation: int) -> bool:
+    return (
+        generation < _forgotten_through
+        or _invalidated_at.get(key, 0) > generation
+    )
+
+
+def cache_summary(
+    case_id: str, patient_id: Optional[str], summary: Any, generation: int
+) -> None:
+    """
+    Stores a summary for a case, evicting the oldest entries past the cap.
+
+    The summary is discarded instead if its case or patient was invalidated
+    after `generation`, i.e. while it was being loaded.
+    """
+    if _invalidated_since(f"case:{case_id}", generation) or (
+        patient_id is not None
+        and _invalidated_since(f"patient:{patient_id}", generation)
+    ):
+        return
+    _summary_cache[case_id] = (
+        time.monotonic() + SUMMARY_TTL_SECONDS,
+        patient_id,
+        summary,
+    )
+    while len(_summary_cache) > SUMMARY_CACHE_SIZE:
+        _summary_cache.popitem(last=False)
+
+
+def invalidate_patient_summaries(
+    patient_id: Optional[str] = None, case_id: Optional[str] = None
+) -> None:
+    """Drops the cached summaries for a patient and/or a case."""
+    global _generation, _forgotten_through
+    if patient_id is None and case_id is None:
+        return
+    _generation += 1
+    for key in (
+        f"case:{case_id}" if case_id is not None else None,
+        f"patient:{patient_id}" if patient_id is not None else None,
+    ):
+        if key is not None:
+            _invalidated_at[key] = _generation
+            _invalidated_at.move_to_end(key)
+    while len(_invalidated_at) > SUMMARY_CACHE_SIZE:
+        _, stamp = _invalidated_at.popitem(last=False)
+        _forgotten_through = max(_forgotten_through, stamp)
+    for key, (_, cached_patient_id, _) in list(_summary_cache.items()):
+        if key == case_id or (
+            patient_id is not None and cached_patient_id == patient_id
+        ):
+            del _summary_cache[key]
@@ -4,3 +4,9 @@ from dotenv import load_dotenv
 load_dotenv()
 
 MONGODB_URI = os.getenv("MONGODB_URI", "mongodb://localhost:27017")
+MONGODB_MAX_POOL_SIZE = int(os.getenv("MONGODB_MAX_POOL_SIZE", 100))
+MONGODB_MIN_POOL_SIZE = int(os.getenv("MONGODB_MIN_POOL_SIZE", 20))
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+# Worker processes for `python main.py`. Summary caches and transcript
+# coalescing are per-process, so only raise this behind sticky routing.
+UVICORN_WORKERS = int(os.getenv("UVICORN_WORKERS", 1))
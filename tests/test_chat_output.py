@@ -0,0 +1,74 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from kernel import chat_output
+from kernel.chat_output import _ask
+
+pytestmark = pytest.mark.asyncio
+
+SYSTEM_PROMPT = "patient data"
+
+
+async def _answer(**kwargs):
+    # Yield once so concurrent callers overlap with the request in flight
+    await asyncio.sleep(0)
+    message = SimpleNamespace(content=f"A:{kwargs['messages'][1]['content']}")
+    return SimpleNamespace(created=1700000000, choices=[SimpleNamespace(message=message)])
+
+
+@pytest.fixture
+def create(monkeypatch):
+    create = AsyncMock(side_effect=_answer)
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    monkeypatch.setattr(chat_output, "get_openai_client", lambda: client)
+    return create
+
+
+async def test_identical_concurrent_questions_share_one_request(create):
+    results = await asyncio.gather(*(_ask(SYSTEM_PROMPT, "q") for _ in range(3)))
+
+    assert results == [("A:q", 1700000000)] * 3
+    assert create.await_count == 1
+
+
+async def test_different_questions_are_sent_separately(create):
+    results = await asyncio.gather(_ask(SYSTEM_PROMPT, "q0"), _ask(SYSTEM_PROMPT, "q1"))
+
+    assert [answer for answer, _ in results] == ["A:q0", "A:q1"]
+    assert create.await_count == 2
+
+
+async def test_completed_request_is_not_reused(create):
+    await _ask(SYSTEM_PROMPT, "q")
+    await _ask(SYSTEM_PROMPT, "q")
+
+    assert create.await_count == 2
+
+
+async def test_error_reaches_every_waiter_and_is_not_cached(create):
+    error = RuntimeError("upstream unavailable")
+    create.side_effect = error
+
+    results = await asyncio.gather(
+        *(_ask(SYSTEM_PROMPT, "q") for _ in range(3)), return_exceptions=True
+    )
+
+    assert results == [error, error, error]
+    assert create.await_count == 1
+
+    create.side_effect = _answer
+    assert await _ask(SYSTEM_PROMPT, "q") == ("A:q", 1700000000)
+
+
+async def test_cancelled_waiter_does_not_cancel_shared_request(create):
+    first = asyncio.ensure_future(_ask(SYSTEM_PROMPT, "q"))
+    second = asyncio.ensure_future(_ask(SYSTEM_PROMPT, "q"))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == ("A:q", 1700000000)
+    assert first.cancelled()
+    assert create.await_count == 1
@@ -0,0 +1,6 @@
+from mock_patient_data import validate_mock_patients
+
+
+def test_mock_patients_match_their_models():
+    # Mock records are built with model_construct, which skips validation
+    validate_mock_patients()